@@ -102,10 +102,17 @@ class FileCache(TileCacheBase):
         """
         if tile.is_missing():
             location = self.tile_location(tile, dimensions=dimensions)
-            if os.path.exists(location):
-                return True
-            else:
+            try:
+                stats = os.lstat(location)
+            except OSError as ex:
+                if ex.errno != errno.ENOENT:
+                    raise
                 return False
+            # store the metadata, saves a second stat call for
+            # freshness checks (see TileManager.is_cached)
+            tile.timestamp = stats.st_mtime
+            tile.size = stats.st_size
+            return True
         else:
             return True
 
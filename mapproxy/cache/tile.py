@@ -236,7 +236,8 @@ class TileManager(object):
         cached = self.cache.is_cached(tile, dimensions=dimensions)
         max_mtime = self.expire_timestamp(tile)
         if cached and max_mtime is not None:
-            self.cache.load_tile_metadata(tile)
+            if tile.timestamp is None:
+                self.cache.load_tile_metadata(tile)
             # file time stamp must be rounded to integer since time conversion functions
             # mktime and timetuple strip decimals from seconds
             stale = int(tile.timestamp) <= max_mtime
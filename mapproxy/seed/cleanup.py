@@ -15,6 +15,7 @@
 
 from __future__ import print_function
 
+import multiprocessing
 import os
 from itertools import zip_longest
 
@@ -46,7 +47,8 @@ def cleanup(tasks, concurrency=2, dry_run=False, skip_geoms_for_last_levels=0,
 
         if task.complete_extent:
             if callable(getattr(task.tile_manager.cache, 'level_location', None)):
-                simple_cleanup(task, dry_run=dry_run, progress_logger=progress_logger,
+                simple_cleanup(task, dry_run=dry_run, concurrency=concurrency,
+                               progress_logger=progress_logger,
                                cleanup_progress=cleanup_progress)
                 task.tile_manager.cleanup()
                 continue
@@ -63,32 +65,58 @@ def cleanup(tasks, concurrency=2, dry_run=False, skip_geoms_for_last_levels=0,
         task.tile_manager.cleanup()
 
 
-def simple_cleanup(task, dry_run, progress_logger=None, cleanup_progress=None):
+def _dry_run_file_handler(filename):
+    print('removing ' + filename)
+
+
+def _cleanup_level_dir(args):
+    # module level function, needs to be picklable for multiprocessing
+    level_dir, remove_timestamp, dry_run = args
+    file_handler = _dry_run_file_handler if dry_run else None
+    cleanup_directory(level_dir, remove_timestamp,
+                      file_handler=file_handler, remove_empty_dirs=True)
+    return level_dir
+
+
+def simple_cleanup(task, dry_run, concurrency=1, progress_logger=None,
+                   cleanup_progress=None):
     """
     Cleanup cache level on file system level.
-    """
 
-    for level in task.levels:
-        level_dir = task.tile_manager.cache.level_location(level)
-        if dry_run:
-            def file_handler(filename):
-                print('removing ' + filename)
-        else:
-            file_handler = None
-        if progress_logger:
+    The levels are independent directory trees and are cleaned up in
+    parallel when `concurrency` is larger than one. Cleanup with a
+    progress store stays serial: resuming depends on the level
+    directories being processed in order.
+    """
+    if progress_logger and progress_logger.progress_store:
+        for level in task.levels:
+            level_dir = task.tile_manager.cache.level_location(level)
             progress_logger.log_message('removing old tiles in ' + normpath(level_dir))
-            if progress_logger.progress_store:
-                cleanup_progress.step_dir(level_dir)
-                if cleanup_progress.already_processed():
-                    continue
-                progress_logger.progress_store.add(
-                    task.id,
-                    cleanup_progress.current_progress_identifier(),
-                )
-                progress_logger.progress_store.write()
-
-        cleanup_directory(level_dir, task.remove_timestamp,
-                          file_handler=file_handler, remove_empty_dirs=True)
+            cleanup_progress.step_dir(level_dir)
+            if cleanup_progress.already_processed():
+                continue
+            progress_logger.progress_store.add(
+                task.id,
+                cleanup_progress.current_progress_identifier(),
+            )
+            progress_logger.progress_store.write()
+            _cleanup_level_dir((level_dir, task.remove_timestamp, dry_run))
+        return
+
+    level_dirs = [task.tile_manager.cache.level_location(level)
+                  for level in task.levels]
+    if progress_logger:
+        for level_dir in level_dirs:
+            progress_logger.log_message('removing old tiles in ' + normpath(level_dir))
+
+    args = [(level_dir, task.remove_timestamp, dry_run) for level_dir in level_dirs]
+    if concurrency > 1 and len(level_dirs) > 1:
+        with multiprocessing.Pool(min(concurrency, len(level_dirs))) as pool:
+            for _ in pool.imap_unordered(_cleanup_level_dir, args):
+                pass
+    else:
+        for arg in args:
+            _cleanup_level_dir(arg)
 
 
 def cache_cleanup(task, dry_run, progress_logger=None):
@@ -16,8 +16,10 @@
 from __future__ import print_function, division
 
 import sys
+from array import array
 from collections import deque
 from contextlib import contextmanager
+from functools import lru_cache
 from itertools import zip_longest
 
 try:
@@ -26,7 +28,9 @@ except ImportError:
     import queue as Queue
 
 from mapproxy.config import base_config
-from mapproxy.grid import MetaGrid
+from mapproxy.grid import MetaGrid, bbox_contains, bbox_intersects
+from mapproxy.util.coverage import BBOXCoverage
+from mapproxy.util import async_
 from mapproxy.source import SourceError
 from mapproxy.config import local_base_config
 from mapproxy.util.lock import LockTimeout
@@ -52,51 +56,135 @@ INTERSECTS = 1
 if sys.platform == 'win32' or (sys.platform == 'darwin' and sys.version_info >= (3, 8)):
     import threading
     proc_class = threading.Thread
+    # queue size is limited with semaphores (see TileWorkerPool),
+    # the queues themselves are unbounded
     queue_class = Queue.Queue
+    semaphore_class = threading.BoundedSemaphore
 else:
     import multiprocessing
     proc_class = multiprocessing.Process
-    queue_class = multiprocessing.Queue
+    # SimpleQueue has no feeder thread and no size limit, messages cross
+    # a single pipe. Queue size is limited with semaphores (see
+    # TileWorkerPool).
+    queue_class = multiprocessing.SimpleQueue
+    semaphore_class = multiprocessing.BoundedSemaphore
+
+
+def _pack_tiles_batch(tiles_batch):
+    """
+    Pack a batch of tile coordinate lists into two flat arrays.
+    Pickling the arrays for the worker queues is a plain buffer copy,
+    instead of a traversal of all coordinate tuples.
+
+    >>> packed = _pack_tiles_batch([[(0, 0, 1)], [(3, 4, 2), (5, 6, 2)]])
+    >>> _unpack_tiles_batch(packed)
+    [[(0, 0, 1)], [(3, 4, 2), (5, 6, 2)]]
+    """
+    lengths = array('I', (len(tiles) for tiles in tiles_batch))
+    coords = array('q')
+    for tiles in tiles_batch:
+        for coord in tiles:
+            coords.extend(coord)
+    return lengths, coords
+
+
+def _unpack_tiles_batch(packed):
+    lengths, coords = packed
+    tiles_batch = []
+    i = 0
+    for length in lengths:
+        tiles = []
+        for _ in range(length):
+            tiles.append((coords[i], coords[i+1], coords[i+2]))
+            i += 3
+        tiles_batch.append(tiles)
+    return tiles_batch
 
 
 class TileWorkerPool(object):
     """
     Manages multiple TileWorker.
+
+    Tile lists are not send to the workers one by one, but are collected in
+    batches of `batch_size` lists. Each batch crosses the queue as a single
+    message, reducing the per-message pickle and locking overhead which
+    otherwise dominates for small tile lists.
     """
 
-    def __init__(self, task, worker_class, size=2, dry_run=False, progress_logger=None):
-        self.tiles_queue = queue_class(size)
+    def __init__(self, task, worker_class, size=2, dry_run=False, progress_logger=None,
+                 batch_size=32):
+        # each worker has its own queue so the producer and all
+        # consumers do not contend on a single queue lock.
+        # the queues are unbounded, flow control is handled with a
+        # credit semaphore per worker: the producer takes a credit for
+        # each message, the worker returns it once the message is
+        # processed. four credits per worker let the traversal run
+        # ahead while all workers are busy.
+        self.tiles_queues = [queue_class() for _ in range(size)]
+        self.credits = [semaphore_class(4) for _ in range(size)]
         self.task = task
         self.dry_run = dry_run
         self.procs = []
+        self.batch_size = batch_size
+        self.pending_batch = []
+        self._next_worker = 0
         self.progress_logger = progress_logger
         conf = base_config()
-        for _ in range(size):
-            worker = worker_class(self.task, self.tiles_queue, conf)
+        for i in range(size):
+            worker = worker_class(self.task, self.tiles_queues[i], self.credits[i], conf)
             worker.start()
             self.procs.append(worker)
 
     def process(self, tiles, progress):
         if not self.dry_run:
-            while True:
-                try:
-                    self.tiles_queue.put(tiles, timeout=5)
-                except Queue.Full:
-                    alive = False
-                    for proc in self.procs:
-                        if proc.is_alive():
-                            alive = True
-                            break
-                    if not alive:
-                        log.warning('no workers left, stopping')
-                        raise SeedInterrupted
-                    continue
-                else:
-                    break
+            self.pending_batch.append(tiles)
+            if len(self.pending_batch) >= self.batch_size:
+                self.flush()
 
             if self.progress_logger:
                 self.progress_logger.log_step(progress)
 
+    def flush(self):
+        """
+        Enqueue all pending tile lists. The pending lists are distributed
+        over all workers so that small workloads are still processed
+        in parallel.
+        """
+        if not self.pending_batch:
+            return
+        batch, self.pending_batch = self.pending_batch, []
+        chunk_size = max(1, (len(batch) + len(self.procs) - 1) // len(self.procs))
+        for i in range(0, len(batch), chunk_size):
+            self._put(batch[i:i+chunk_size])
+
+    def _put(self, tiles_batch):
+        tiles_batch = _pack_tiles_batch(tiles_batch)
+        while True:
+            # dispatch round-robin, but route around workers
+            # that are out of credits
+            for _ in range(len(self.tiles_queues)):
+                worker = self._next_worker
+                self._next_worker = (self._next_worker + 1) % len(self.tiles_queues)
+                if self.credits[worker].acquire(False):
+                    self.tiles_queues[worker].put(tiles_batch)
+                    return
+
+            # all workers are out of credits
+            alive = False
+            for proc in self.procs:
+                if proc.is_alive():
+                    alive = True
+                    break
+            if not alive:
+                log.warning('no workers left, stopping')
+                raise SeedInterrupted
+
+            worker = self._next_worker
+            self._next_worker = (self._next_worker + 1) % len(self.tiles_queues)
+            if self.credits[worker].acquire(True, 5):
+                self.tiles_queues[worker].put(tiles_batch)
+                return
+
     def stop(self, force=False):
         """
         Stop seed workers by sending None-sentinel and joining the workers.
@@ -105,21 +193,16 @@ class TileWorkerPool(object):
                       For use when workers might be shutdown already by KeyboardInterrupt.
         """
         if not force:
-            alives = 0
-            for proc in self.procs:
-                if proc.is_alive():
-                    alives += 1
+            try:
+                self.flush()
+            except SeedInterrupted:
+                # nothing to flush to when all workers are gone
+                pass
 
-            while alives:
-                # put None-sentinels to queue as long as we have workers alive
-                try:
-                    self.tiles_queue.put(None, timeout=1)
-                    alives -= 1
-                except Queue.Full:
-                    alives = 0
-                    for proc in self.procs:
-                        if proc.is_alive():
-                            alives += 1
+            # put a None-sentinel to the queue of each worker. the queues
+            # are unbounded, the sentinel needs no credit and never blocks
+            for tiles_queue in self.tiles_queues:
+                tiles_queue.put(None)
 
         if force:
             timeout = 1.0
@@ -130,12 +213,13 @@ class TileWorkerPool(object):
 
 
 class TileWorker(proc_class):
-    def __init__(self, task, tiles_queue, conf):
+    def __init__(self, task, tiles_queue, credits, conf):
         proc_class.__init__(self)
         proc_class.daemon = True
         self.task = task
         self.tile_mgr = task.tile_manager
         self.tiles_queue = tiles_queue
+        self.credits = credits
         self.conf = conf
 
     def run(self):
@@ -151,23 +235,51 @@ class TileWorker(proc_class):
 class TileSeedWorker(TileWorker):
     def work_loop(self):
         while True:
-            tiles = self.tiles_queue.get()
-            if tiles is None:
+            tiles_batch = self.tiles_queue.get()
+            if tiles_batch is None:
                 return
-            with self.tile_mgr.session():
-                exp_backoff(self.tile_mgr.load_tile_coords, args=(tiles,),
-                            max_repeat=100, max_backoff=600,
-                            exceptions=(SourceError, IOError), ignore_exceptions=(LockTimeout, ))
+            try:
+                tiles_batch = _unpack_tiles_batch(tiles_batch)
+                with self.tile_mgr.session():
+                    # overlap the source requests of a batch when the cache
+                    # is configured with concurrent_tile_creators
+                    concurrent_fetches = min(len(tiles_batch), self.tile_mgr.concurrent_tile_creators)
+                    if concurrent_fetches > 1:
+                        pool = async_.Pool(concurrent_fetches)
+                        pool.map(self.seed_tiles, tiles_batch)
+                    else:
+                        for tiles in tiles_batch:
+                            self.seed_tiles(tiles)
+            finally:
+                # return the credit to the producer, even when the
+                # worker is about to die from an exception
+                self.credits.release()
+
+    def seed_tiles(self, tiles):
+        # the tiles were uncached (or stale) when the walker checked them,
+        # but another worker might have created them in the meantime,
+        # e.g. when the walker enqueued the same metatile twice
+        # (see TileWalker.seeded_tiles)
+        tiles = [t for t in tiles if not self.tile_mgr.is_cached(t)]
+        if not tiles:
+            return
+        exp_backoff(self.tile_mgr.load_tile_coords, args=(tiles,),
+                    max_repeat=100, max_backoff=600,
+                    exceptions=(SourceError, IOError), ignore_exceptions=(LockTimeout, ))
 
 
 class TileCleanupWorker(TileWorker):
     def work_loop(self):
         while True:
-            tiles = self.tiles_queue.get()
-            if tiles is None:
+            tiles_batch = self.tiles_queue.get()
+            if tiles_batch is None:
                 return
-            with self.tile_mgr.session():
-                self.tile_mgr.remove_tile_coords(tiles)
+            try:
+                for tiles in _unpack_tiles_batch(tiles_batch):
+                    with self.tile_mgr.session():
+                        self.tile_mgr.remove_tile_coords(tiles)
+            finally:
+                self.credits.release()
 
 
 class SeedProgress(object):
@@ -302,6 +414,9 @@ class TileWalker(object):
         meta_size = self.tile_mgr.meta_grid.meta_size if self.tile_mgr.meta_grid else (1, 1)
         self.tiles_per_metatile = meta_size[0] * meta_size[1]
         self.grid = MetaGrid(self.tile_mgr.grid, meta_size=meta_size, meta_buffer=0)
+        # memoize the metatile bbox calculation: irregular tile grids (see
+        # seeded_tiles below) walk through the same tiles multiple times
+        self._meta_bbox = lru_cache(maxsize=1024)(self.grid.unbuffered_meta_bbox)
         self.count = 0
         self.seed_progress = seed_progress or SeedProgress()
 
@@ -336,6 +451,29 @@ class TileWalker(object):
         self.report_progress(self.task.levels[0], self.task.coverage.bbox)
 
     def _walk(self, cur_bbox, levels, current_level=0, all_subtiles=False):
+        """
+        Walk the tile pyramid depth-first with an explicit stack of
+        `_walk_gen` generators. Each generator yields the arguments for
+        the next deeper level instead of recursing, which avoids a
+        Python call frame per node and any recursion limit concerns for
+        deep grids. A suspended generator sits inside its step_down()
+        block, so progress tracking behaves exactly as with recursion.
+        """
+        stack = [self._walk_gen(cur_bbox, levels, current_level, all_subtiles)]
+        try:
+            while stack:
+                try:
+                    step_args = next(stack[-1])
+                except StopIteration:
+                    stack.pop()
+                else:
+                    stack.append(self._walk_gen(*step_args))
+        finally:
+            # unwind suspended generators (StopProcess, KeyboardInterrupt)
+            for gen in reversed(stack):
+                gen.close()
+
+    def _walk_gen(self, cur_bbox, levels, current_level=0, all_subtiles=False):
         """
         :param cur_bbox: the bbox to seed in this call
         :param levels: list of levels to seed
@@ -347,7 +485,10 @@ class TileWalker(object):
         if len(levels) < self.skip_geoms_for_last_levels:
             # do not filter in last levels
             all_subtiles = True
-        subtiles = self._filter_subtiles(subtiles, all_subtiles)
+        if not all_subtiles and self.task.intersects(cur_bbox) == CONTAINS:
+            # cur_bbox is completely within the coverage:
+            # no need to check the intersection of each subtile
+            all_subtiles = True
 
         if current_level in levels and current_level <= self.report_till_level:
             self.report_progress(current_level, cur_bbox)
@@ -363,9 +504,17 @@ class TileWalker(object):
             levels = levels[1:]
             process = True
 
+        # the sub_bboxes are only needed to recurse into deeper levels
+        subtiles = self._filter_subtiles(subtiles, all_subtiles,
+                                         need_bboxes=bool(levels))
+
+        # hoist repeated attribute lookups out of the subtile loop
+        seed_progress = self.seed_progress
+        seeded_tiles = self.seeded_tiles.get(current_level)
+
         for i, (subtile, sub_bbox, intersection) in enumerate(subtiles):
             if subtile is None:  # no intersection
-                self.seed_progress.step_forward(total_subtiles)
+                seed_progress.step_forward(total_subtiles)
                 continue
             if levels:  # recurse to next level
                 sub_bbox = limit_sub_bbox(cur_bbox, sub_bbox)
@@ -374,22 +523,22 @@ class TileWalker(object):
                 else:
                     all_subtiles = False
 
-                with self.seed_progress.step_down(i, total_subtiles):
-                    if self.seed_progress.already_processed():
-                        self.seed_progress.step_forward()
+                with seed_progress.step_down(i, total_subtiles):
+                    if seed_progress.already_processed():
+                        seed_progress.step_forward()
                     else:
-                        self._walk(sub_bbox, levels, current_level=current_level+1,
-                                   all_subtiles=all_subtiles)
+                        # hand over to the _walk driver loop
+                        yield (sub_bbox, levels, current_level+1, all_subtiles)
 
             if not process:
                 continue
 
             # check if subtile was already processed. see comment in __init__
-            if subtile in self.seeded_tiles[current_level]:
+            if subtile in seeded_tiles:
                 if not levels:
-                    self.seed_progress.step_forward(total_subtiles)
+                    seed_progress.step_forward(total_subtiles)
                 continue
-            self.seeded_tiles[current_level].appendleft(subtile)
+            seeded_tiles.appendleft(subtile)
 
             if not self.work_on_metatiles:
                 # collect actual tiles
@@ -422,25 +571,69 @@ class TileWalker(object):
             self.progress_logger.log_progress(self.seed_progress, level, bbox,
                                               self.count * self.tiles_per_metatile)
 
-    def _filter_subtiles(self, subtiles, all_subtiles):
+    def _filter_subtiles(self, subtiles, all_subtiles, need_bboxes=True):
         """
         Return an iterator with all sub tiles.
         Yields (None, None, None) for non-intersecting tiles,
         otherwise (subtile, subtile_bbox, intersection).
+
+        The intersections of all subtiles are determined with a single
+        bulk query against the coverage. The subtile_bbox is only
+        computed when it is required for the intersection check or
+        when `need_bboxes` is set.
         """
-        for subtile in subtiles:
+        # self.grid has no meta_buffer, the unbuffered bbox is the
+        # metatile bbox. This avoids building a complete MetaTile
+        # (size, tile patterns) for each subtile.
+        meta_bbox = self._meta_bbox
+
+        if all_subtiles:
+            for subtile in subtiles:
+                if subtile is None:
+                    yield None, None, None
+                else:
+                    yield subtile, meta_bbox(subtile) if need_bboxes else None, CONTAINS
+            return
+
+        subtiles = [(subtile, meta_bbox(subtile) if subtile is not None else None)
+                    for subtile in subtiles]
+        intersections = iter(self.task.intersects_all(
+            [sub_bbox for subtile, sub_bbox in subtiles if subtile is not None]))
+        for subtile, sub_bbox in subtiles:
             if subtile is None:
                 yield None, None, None
+                continue
+            intersection = next(intersections)
+            if intersection:
+                yield subtile, sub_bbox, intersection
             else:
-                sub_bbox = self.grid.meta_tile(subtile).bbox
-                if all_subtiles:
-                    intersection = CONTAINS
-                else:
-                    intersection = self.task.intersects(sub_bbox)
-                if intersection:
-                    yield subtile, sub_bbox, intersection
-                else:
-                    yield None, None, None
+                yield None, None, None
+
+
+def _specialized_intersects(coverage, srs):
+    """
+    Build a specialized ``intersects(bbox)`` function for plain bbox
+    coverages in the grid SRS.
+
+    The generic path goes through ``Coverage.contains``/``intersects``
+    with an SRS comparison and several attribute lookups per call. The
+    coverage is constant for the whole task, so bind its bbox and the
+    comparison functions once in a closure.
+
+    Returns ``None`` when the coverage requires the generic path
+    (geometries, multi coverages, different SRS).
+    """
+    if not isinstance(coverage, BBOXCoverage) or coverage.srs != srs:
+        return None
+    cov_bbox = coverage.bbox
+
+    def intersects(bbox, _contains=bbox_contains, _intersects=bbox_intersects):
+        if _contains(cov_bbox, bbox):
+            return CONTAINS
+        if _intersects(cov_bbox, bbox):
+            return INTERSECTS
+        return NONE
+    return intersects
 
 
 class SeedTask(object):
@@ -451,6 +644,9 @@ class SeedTask(object):
         self.levels = levels
         self.refresh_timestamp = refresh_timestamp
         self.coverage = coverage
+        specialized = _specialized_intersects(coverage, self.grid.srs)
+        if specialized is not None:
+            self.intersects = specialized
 
     @property
     def id(self):
@@ -463,6 +659,17 @@ class SeedTask(object):
             return INTERSECTS
         return NONE
 
+    def intersects_all(self, bboxes):
+        intersections = []
+        for intersects, contains in self.coverage.classify_bboxes(bboxes, self.grid.srs):
+            if contains:
+                intersections.append(CONTAINS)
+            elif intersects:
+                intersections.append(INTERSECTS)
+            else:
+                intersections.append(NONE)
+        return intersections
+
 
 class CleanupTask(object):
     """
@@ -478,6 +685,9 @@ class CleanupTask(object):
         self.remove_timestamp = remove_timestamp
         self.coverage = coverage
         self.complete_extent = complete_extent
+        specialized = _specialized_intersects(coverage, self.grid.srs)
+        if specialized is not None:
+            self.intersects = specialized
 
     @property
     def id(self):
@@ -490,6 +700,17 @@ class CleanupTask(object):
             return INTERSECTS
         return NONE
 
+    def intersects_all(self, bboxes):
+        intersections = []
+        for intersects, contains in self.coverage.classify_bboxes(bboxes, self.grid.srs):
+            if contains:
+                intersections.append(CONTAINS)
+            elif intersects:
+                intersections.append(INTERSECTS)
+            else:
+                intersections.append(NONE)
+        return intersections
+
 
 def seed(tasks, concurrency=2, dry_run=False, skip_geoms_for_last_levels=0,
          progress_logger=None, cache_locker=None, skip_uncached=False):
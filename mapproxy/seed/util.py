@@ -18,7 +18,6 @@ from __future__ import print_function, division
 import os
 import sys
 import stat
-import math
 import time
 from datetime import datetime
 
@@ -97,6 +96,10 @@ class ProgressLog(object):
         if not out:
             out = sys.stdout
         self.out = out
+        # \r-overwritten step lines are only useful on a terminal.
+        # skipping them for redirected output avoids a write and flush
+        # syscall per step and keeps log files free of control characters.
+        self._out_isatty = getattr(out, 'isatty', lambda: False)()
         self._laststep = time.time()
         self._lastprogress = 0
 
@@ -112,15 +115,16 @@ class ProgressLog(object):
         self.out.flush()
 
     def log_step(self, progress):
-        if not self.verbose:
+        if not self.verbose or not self._out_isatty:
             return
-        if (self._laststep + .5) < time.time():
+        now = time.time()
+        if (self._laststep + .5) < now:
             # log progress at most every 500ms
             self.out.write('[%s] %6.2f%%\t%-20s \r' % (
                 timestamp(), progress.progress*100, progress.progress_str,
             ))
             self.out.flush()
-            self._laststep = time.time()
+            self._laststep = now
 
     def log_progress(self, progress, level, bbox, tiles):
         progress_interval = 1
@@ -128,8 +132,9 @@ class ProgressLog(object):
             progress_interval = 30
 
         log_progess = False
-        if progress.progress == 1.0 or (self._lastprogress + progress_interval) < time.time():
-            self._lastprogress = time.time()
+        now = time.time()
+        if progress.progress == 1.0 or (self._lastprogress + progress_interval) < now:
+            self._lastprogress = now
             log_progess = True
 
         if log_progess:
@@ -170,6 +175,9 @@ def format_bbox(bbox):
     return ('%.5f, %.5f, %.5f, %.5f') % tuple(bbox)
 
 
+_STATUS_SYMBOLS = (' ', '.', 'o', 'O', '0')
+
+
 def status_symbol(i, total):
     """
     >>> status_symbol(0, 1)
@@ -179,12 +187,11 @@ def status_symbol(i, total):
     >>> [status_symbol(i, 10) for i in range(11)]
     ['.', '.', 'o', 'o', 'o', 'O', 'O', '0', '0', '0', 'X']
     """
-    symbols = list(' .oO0')
     i += 1
     if 0 < i > total:
         return 'X'
-    else:
-        return symbols[int(math.ceil(i/(total/4)))]
+    # integer variant of ceil(i / (total / 4))
+    return _STATUS_SYMBOLS[(i * 4 + total - 1) // total]
 
 
 class BackoffError(Exception):
@@ -194,11 +201,15 @@ class BackoffError(Exception):
 def exp_backoff(func, args=(), kw={}, max_repeat=10, start_backoff_sec=2,
                 exceptions=(Exception,), ignore_exceptions=tuple(), max_backoff=60):
     n = 0
+    ignored = 0
     while True:
         try:
             result = func(*args, **kw)
         except ignore_exceptions:
-            time.sleep(0.01)
+            # back off a bit more on each ignored error (e.g. lock timeouts)
+            # so we don't busy-wait, but stay responsive
+            ignored += 1
+            time.sleep(min(0.01 * ignored, 0.5))
         except exceptions as ex:
             if n >= max_repeat:
                 print("An error occured. Giving up", file=sys.stderr)
@@ -213,6 +213,31 @@ class _SRS_Proj4_API(object):
 
         return result
 
+    def transform_bboxes_to(self, other_srs, bboxes, with_points=16):
+        """
+        Transform multiple bboxes with a single transformation call.
+        Returns the same results as calling `transform_bbox_to` for
+        each bbox.
+
+        >>> bboxes = [(8.2, 53.1, 8.3, 53.2), (9.0, 52.0, 9.5, 52.5)]
+        >>> (SRS(4326).transform_bboxes_to(SRS(3857), bboxes) ==
+        ...  [SRS(4326).transform_bbox_to(SRS(3857), bbox) for bbox in bboxes])
+        True
+        """
+        if self == other_srs:
+            return list(bboxes)
+        bboxes = list(bboxes)
+        if not bboxes:
+            return []
+        points = []
+        for bbox in bboxes:
+            points.extend(generate_envelope_points(self.align_bbox(bbox), with_points))
+        transf_pts = list(self.transform_to(other_srs, points))
+        # generate_envelope_points returns the same number of points for each bbox
+        n = len(transf_pts) // len(bboxes)
+        return [calculate_bbox(transf_pts[i:i+n])
+                for i in range(0, len(transf_pts), n)]
+
     def align_bbox(self, bbox):
         """
         Align bbox to reasonable values to prevent errors in transformations.
@@ -420,6 +445,10 @@ class _SRS(object):
         log_proj.debug('transformed from %r to %r (%s -> %s)',
                        self, other_srs, bbox, result)
 
+        result = self._adjust_to_webmercator_bounds(other_srs, bbox, result)
+        return result
+
+    def _adjust_to_webmercator_bounds(self, other_srs, bbox, result):
         # XXX: 3857 is only defined within 85.06 N/S, new Proj returns 'inf' for coords
         # outside of these bounds. Adjust bbox for 4326->3857 transformations to the old
         # behavior, as this is expected in a few places (WMS layer extents and quite a few
@@ -437,6 +466,32 @@ class _SRS(object):
             result = (minx, miny, maxx, maxy)
         return result
 
+    def transform_bboxes_to(self, other_srs, bboxes, with_points=16):
+        """
+        Transform multiple bboxes with a single transformation call.
+        Returns the same results as calling `transform_bbox_to` for
+        each bbox.
+
+        >>> bboxes = [(8.2, 53.1, 8.3, 53.2), (9.0, 52.0, 9.5, 52.5)]
+        >>> (SRS(4326).transform_bboxes_to(SRS(3857), bboxes) ==
+        ...  [SRS(4326).transform_bbox_to(SRS(3857), bbox) for bbox in bboxes])
+        True
+        """
+        if self == other_srs:
+            return list(bboxes)
+        bboxes = list(bboxes)
+        if not bboxes:
+            return []
+        points = []
+        for bbox in bboxes:
+            points.extend(generate_envelope_points(bbox, with_points))
+        transf_pts = list(self.transform_to(other_srs, points))
+        # generate_envelope_points returns the same number of points for each bbox
+        n = len(transf_pts) // len(bboxes)
+        return [self._adjust_to_webmercator_bounds(
+                    other_srs, bbox, calculate_bbox(transf_pts[i:i+n]))
+                for bbox, i in zip(bboxes, range(0, len(transf_pts), n))]
+
     @property
     def is_latlong(self):
         """
@@ -238,6 +238,13 @@ class TestGeomCoverage(object):
         assert not self.coverage.intersects((0, 0, 1000, 1000), SRS(900913))
         assert self.coverage.intersects((0, 0, 1500000, 1500000), SRS(900913))
 
+    def test_classify_bboxes(self):
+        assert self.coverage.classify_bboxes([
+            (15, 15, 20, 20),
+            (9, 10, 20, 20),
+            (-30, 10, -11, 70),
+        ], SRS(4326)) == [(True, True), (True, False), (False, False)]
+
     def test_prepared(self):
         assert hasattr(self.coverage, '_prepared_max')
         self.coverage._prepared_max = 100
@@ -281,6 +288,13 @@ class TestBBOXCoverage(object):
         assert not self.coverage.intersects((0, 0, 1000, 1000), SRS(900913))
         assert self.coverage.intersects((0, 0, 1500000, 1500000), SRS(900913))
 
+    def test_classify_bboxes(self):
+        assert self.coverage.classify_bboxes([
+            (15, 15, 20, 20),
+            (-30, 10, -8, 70),
+            (-30, 10, -11, 70),
+        ], SRS(4326)) == [(True, True), (True, False), (False, False)]
+
     def test_intersection(self):
         assert (self.coverage.intersection((15, 15, 20, 20), SRS(4326)) ==
                 BBOXCoverage((15, 15, 20, 20), SRS(4326)))
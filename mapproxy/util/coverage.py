@@ -33,11 +33,14 @@ from functools import reduce
 log_config = logging.getLogger('mapproxy.config.coverage')
 
 try:
+    import shapely
     import shapely.geometry
     import shapely.prepared
+    # vectorized predicates for bulk queries require Shapely 2.x
+    _shapely_supports_bulk = hasattr(shapely, 'box')
 except ImportError:
     # missing Shapely is handled by require_geom_support
-    pass
+    _shapely_supports_bulk = False
 
 
 def coverage(geom, srs, clip=False):
@@ -80,6 +83,13 @@ class MultiCoverage(object):
     def intersects(self, bbox, srs):
         return any(c.intersects(bbox, srs) for c in self.coverages)
 
+    def classify_bboxes(self, bboxes, srs):
+        results = [(False, False)] * len(bboxes)
+        for c in self.coverages:
+            for i, (intersects, contains) in enumerate(c.classify_bboxes(bboxes, srs)):
+                results[i] = (results[i][0] or intersects, results[i][1] or contains)
+        return results
+
     def contains(self, bbox, srs):
         return any(c.contains(bbox, srs) for c in self.coverages)
 
@@ -153,6 +163,17 @@ class BBOXCoverage(object):
         bbox = self._bbox_in_coverage_srs(bbox, srs)
         return bbox_contains(self.bbox, bbox)
 
+    def classify_bboxes(self, bboxes, srs):
+        """
+        Classify multiple bboxes against this coverage in a single call.
+
+        :return: a list with an ``(intersects, contains)`` tuple for each bbox
+        """
+        if srs != self.srs:
+            bboxes = srs.transform_bboxes_to(self.srs, bboxes)
+        return [(bbox_intersects(self.bbox, bbox), bbox_contains(self.bbox, bbox))
+                for bbox in bboxes]
+
     def transform_to(self, srs):
         if srs == self.srs:
             return self
@@ -190,6 +211,7 @@ class GeomCoverage(object):
         self._prep_lock = threading.Lock()
         self._prepared_geom = None
         self._prepared_counter = 0
+        self._bulk_prepared_counter = 0
         self._prepared_max = 10000
 
     @property
@@ -228,8 +250,24 @@ class GeomCoverage(object):
         geom = transform_geometry(self.srs, srs, self.geom)
         return GeomCoverage(geom, srs, clip=self.clip)
 
+    def _is_disjoint_bbox(self, bbox):
+        """
+        Return True if `bbox` is completely outside the bbox of this coverage.
+        Touching bboxes are not disjoint, like GEOS intersects.
+        """
+        minx, miny, maxx, maxy = self.bbox
+        return bbox[0] > maxx or bbox[2] < minx or bbox[1] > maxy or bbox[3] < miny
+
     def intersects(self, bbox, srs):
-        bbox = self._geom_in_coverage_srs(bbox, srs)
+        if not isinstance(bbox, shapely.geometry.base.BaseGeometry) and len(bbox) == 4:
+            # cheap bbox check before the exact geometry test
+            if srs != self.srs:
+                bbox = srs.transform_bbox_to(self.srs, bbox)
+            if self._is_disjoint_bbox(bbox):
+                return False
+            bbox = bbox_polygon(bbox)
+        else:
+            bbox = self._geom_in_coverage_srs(bbox, srs)
         with self._prep_lock:
             return self.prepared_geom.intersects(bbox)
 
@@ -238,10 +276,59 @@ class GeomCoverage(object):
         return GeomCoverage(self.geom.intersection(bbox), self.srs, clip=self.clip)
 
     def contains(self, bbox, srs):
-        bbox = self._geom_in_coverage_srs(bbox, srs)
+        if not isinstance(bbox, shapely.geometry.base.BaseGeometry) and len(bbox) == 4:
+            # cheap bbox check before the exact geometry test
+            if srs != self.srs:
+                bbox = srs.transform_bbox_to(self.srs, bbox)
+            if not bbox_contains(self.bbox, bbox):
+                return False
+            bbox = bbox_polygon(bbox)
+        else:
+            bbox = self._geom_in_coverage_srs(bbox, srs)
         with self._prep_lock:
             return self.prepared_geom.contains(bbox)
 
+    def classify_bboxes(self, bboxes, srs):
+        """
+        Classify multiple bboxes against this coverage in a single call.
+
+        :return: a list with an ``(intersects, contains)`` tuple for each bbox
+        """
+        if not bboxes:
+            return []
+        if srs != self.srs:
+            bboxes = srs.transform_bboxes_to(self.srs, bboxes)
+
+        if _shapely_supports_bulk:
+            minx, miny, maxx, maxy = zip(*bboxes)
+            boxes = shapely.box(minx, miny, maxx, maxy)
+            with self._prep_lock:
+                # see prepared_geom: recreate prepared geometry
+                # to limit memory consumption
+                if self._bulk_prepared_counter > self._prepared_max:
+                    shapely.destroy_prepared(self.geom)
+                    self._bulk_prepared_counter = 0
+                shapely.prepare(self.geom)
+                self._bulk_prepared_counter += len(bboxes)
+                intersects = shapely.intersects(self.geom, boxes)
+                contains = shapely.contains(self.geom, boxes)
+            return list(zip(intersects.tolist(), contains.tolist()))
+
+        results = []
+        for bbox in bboxes:
+            if self._is_disjoint_bbox(bbox):
+                results.append((False, False))
+                continue
+            geom = bbox_polygon(bbox)
+            with self._prep_lock:
+                if self.prepared_geom.contains(geom):
+                    results.append((True, True))
+                elif self.prepared_geom.intersects(geom):
+                    results.append((True, False))
+                else:
+                    results.append((False, False))
+        return results
+
     def __eq__(self, other):
         if not isinstance(other, GeomCoverage):
             return NotImplemented
@@ -22,6 +22,15 @@ class YAMLError(Exception):
     pass
 
 
+# resolve the fastest available safe loader once at import time:
+# the C-backed loader (libyaml) parses large configurations many
+# times faster than the pure-Python one
+if getattr(yaml, '__with_libyaml__', False):
+    _loader_class = yaml.CSafeLoader
+else:
+    _loader_class = yaml.SafeLoader
+
+
 def load_yaml_file(file_or_filename):
     """
     Load yaml from file object or filename.
@@ -33,16 +42,15 @@ def load_yaml_file(file_or_filename):
 
 
 def _load_yaml(doc):
-    # try different methods to load yaml
+    global _loader_class
     try:
-        if getattr(yaml, '__with_libyaml__', False):
-            try:
-                return yaml.load(doc, Loader=yaml.CSafeLoader)
-            except AttributeError:
-                # handle cases where __with_libyaml__ is True but
-                # CLoader doesn't work (missing .dispose())
-                return yaml.safe_load(doc)
-        return yaml.safe_load(doc)
+        try:
+            return yaml.load(doc, Loader=_loader_class)
+        except AttributeError:
+            # handle cases where __with_libyaml__ is True but
+            # CLoader doesn't work (missing .dispose())
+            _loader_class = yaml.SafeLoader
+            return yaml.load(doc, Loader=_loader_class)
     except (yaml.scanner.ScannerError, yaml.parser.ParserError) as ex:
         raise YAMLError(str(ex))
 